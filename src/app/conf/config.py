@@ -1,43 +1,81 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-# API URLs
-ORDERS_API_URL = os.getenv('ORDERS_API_URL')
-INVENTORY_API_URL = os.getenv('INVENTORY_API_URL')
-
-# Google Sheets Configuration
-CREDENTIALS_FILE_NAME = os.getenv('CREDENTIALS_FILE_NAME')
-SHEET_NAME = os.getenv('SHEET_NAME')
-ORDERS_WORKSHEET_NAME = os.getenv('ORDERS_WORKSHEET_NAME')
-INVENTORY_WORKSHEET_NAME = os.getenv('INVENTORY_WORKSHEET_NAME')
-
-# Retry Configuration
-MAX_RETRIES = int(os.getenv('MAX_RETRIES'))
-RETRY_DELAY = int(os.getenv('RETRY_DELAY'))
-
-# Spreadsheet positioning
-ORDERS_START_ROW = int(os.getenv('ORDERS_START_ROW'))      
-ORDERS_START_COL = int(os.getenv('ORDERS_START_COL'))      
-INVENTORY_START_ROW = int(os.getenv('INVENTORY_START_ROW')) 
-INVENTORY_START_COL = int(os.getenv('INVENTORY_START_COL')) 
-
-# Validation function (optional)
-def validate_config():
-    """Validate that required environment variables are set."""
-    required_vars = ['ORDERS_API_URL', 'INVENTORY_API_URL']
-    missing_vars = []
-    
-    for var in required_vars:
-        if not globals().get(var):
-            missing_vars.append(var)
-    
+# Variables that have no sensible default and must be set
+REQUIRED_VARS = ['ORDERS_API_URL', 'INVENTORY_API_URL', 'SHEET_NAME']
+
+
+@dataclass(frozen=True)
+class Config:
+    """Typed, validated snapshot of the environment configuration."""
+
+    # API URLs
+    orders_api_url: str
+    inventory_api_url: str
+
+    # Google Sheets Configuration
+    credentials_file_name: str
+    sheet_name: str
+    orders_worksheet_name: str
+    inventory_worksheet_name: str
+
+    # Retry Configuration
+    max_retries: int
+    retry_delay: int
+
+    # Spreadsheet positioning
+    orders_start_row: int
+    orders_start_col: int
+    inventory_start_row: int
+    inventory_start_col: int
+
+
+def _get_int(name: str, default: int, minimum: Optional[int] = None) -> int:
+    """Read an integer environment variable, with a clear error if it is malformed or too small."""
+    value = os.getenv(name)
+    if value is None or value.strip() == '':
+        return default
+    try:
+        result = int(value)
+    except ValueError:
+        raise ValueError(f"Environment variable {name} must be an integer, got {value!r}") from None
+    if minimum is not None and result < minimum:
+        raise ValueError(f"Environment variable {name} must be >= {minimum}, got {result}")
+    return result
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Read, cast and validate the environment configuration once per process.
+
+    Returns:
+        Frozen Config snapshot
+
+    Raises:
+        ValueError: If a required variable is missing or a numeric variable is malformed or out of range
+    """
+    missing_vars = [var for var in REQUIRED_VARS if not os.getenv(var)]
     if missing_vars:
         raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
-    
-    return True
 
-# Optional: Validate on import
-# validate_config()
\ No newline at end of file
+    return Config(
+        orders_api_url=os.getenv('ORDERS_API_URL'),
+        inventory_api_url=os.getenv('INVENTORY_API_URL'),
+        credentials_file_name=os.getenv('CREDENTIALS_FILE_NAME', 'credentials.json'),
+        sheet_name=os.getenv('SHEET_NAME'),
+        orders_worksheet_name=os.getenv('ORDERS_WORKSHEET_NAME', 'Orders'),
+        inventory_worksheet_name=os.getenv('INVENTORY_WORKSHEET_NAME', 'Inventory'),
+        max_retries=_get_int('MAX_RETRIES', 3, minimum=1),
+        retry_delay=_get_int('RETRY_DELAY', 5, minimum=0),
+        orders_start_row=_get_int('ORDERS_START_ROW', 1, minimum=1),
+        orders_start_col=_get_int('ORDERS_START_COL', 1, minimum=1),
+        inventory_start_row=_get_int('INVENTORY_START_ROW', 1, minimum=1),
+        inventory_start_col=_get_int('INVENTORY_START_COL', 1, minimum=1),
+    )
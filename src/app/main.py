@@ -7,20 +7,31 @@ Original file is located at:
     https://colab.research.google.com/drive/1peuajyInnS2Lh7L1LCm-V86fdiAVpln5
 """
 
+import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
-import time
 import os
+import aiohttp
+import gspread
+import numpy as np
+import orjson
 import pandas as pd
-import requests
-from typing import Optional, Dict, Any, Tuple
+from gspread.urls import SPREADSHEET_VALUES_URL
+from gspread.utils import absolute_range_name, rowcol_to_a1
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple, Awaitable, Mapping
 from datetime import datetime
+from urllib.parse import quote
 
 try:
-    from .conf import config
+    from .conf.config import get_config
     
-    # Validate configuration on startup
-    config.validate_config()
+    # Read and validate configuration once on startup
+    cfg = get_config()
     
 except ImportError as e:
     print(f"Error: Could not import config from conf folder: {e}")
@@ -40,15 +51,24 @@ log_directory = os.path.join("content", "logs")
 os.makedirs(log_directory, exist_ok=True)
 log_filepath = os.path.join(log_directory, log_filename)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-    handlers=[
-        logging.FileHandler(log_filepath, encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging: callers only enqueue records, a background listener thread does the file/console I/O
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s')
+log_handlers = [
+    logging.handlers.RotatingFileHandler(log_filepath, encoding='utf-8', maxBytes=10_000_000, backupCount=3),
+    logging.StreamHandler(sys.stdout)
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+log_listener.start()
+atexit.register(log_listener.stop)  # Drain the queue and flush handlers on interpreter exit
 
 logger = logging.getLogger(__name__)
 
@@ -56,26 +76,71 @@ logger = logging.getLogger(__name__)
 logger.info(f"Log file created at: {log_filepath}")
 
 # Configuration constants
-ORDERS_API_URL = config.ORDERS_API_URL
-INVENTORY_API_URL = config.INVENTORY_API_URL
-CREDENTIALS_FILE = os.path.join("conf", config.CREDENTIALS_FILE_NAME)
-SHEET_NAME = config.SHEET_NAME
-ORDERS_WORKSHEET_NAME = config.ORDERS_WORKSHEET_NAME
-INVENTORY_WORKSHEET_NAME = config.INVENTORY_WORKSHEET_NAME
-MAX_RETRIES = config.MAX_RETRIES
-RETRY_DELAY = config.RETRY_DELAY 
-
-ORDERS_START_ROW = config.ORDERS_START_ROW      
-ORDERS_START_COL = config.ORDERS_START_COL      
-INVENTORY_START_ROW = config.INVENTORY_START_ROW   
-INVENTORY_START_COL = config.INVENTORY_START_COL   
-
-
-def fetch_api_data(url: str, data_type: str, max_retries: int = MAX_RETRIES) -> Optional[Dict[Any, Any]]:
+ORDERS_API_URL = cfg.orders_api_url
+INVENTORY_API_URL = cfg.inventory_api_url
+CREDENTIALS_FILE = os.path.join("conf", cfg.credentials_file_name)
+SHEET_NAME = cfg.sheet_name
+ORDERS_WORKSHEET_NAME = cfg.orders_worksheet_name
+INVENTORY_WORKSHEET_NAME = cfg.inventory_worksheet_name
+MAX_RETRIES = cfg.max_retries
+RETRY_DELAY = cfg.retry_delay 
+
+ORDERS_START_ROW = cfg.orders_start_row      
+ORDERS_START_COL = cfg.orders_start_col      
+INVENTORY_START_ROW = cfg.inventory_start_row   
+INVENTORY_START_COL = cfg.inventory_start_col   
+
+# Data type conversions applied to each dataset
+ORDERS_CONVERSIONS = MappingProxyType({
+    'order_id': str,
+    'store_id': int,
+    'quantity': int
+})
+INVENTORY_CONVERSIONS = MappingProxyType({
+    'store_id': int,
+    'quantity': int
+})
+
+# HTTP client settings for API fetches
+HTTP_TIMEOUT = 30              # seconds per request
+HTTP_POOL_SIZE = 4             # max pooled connections
+HTTP_KEEPALIVE_TIMEOUT = 30    # seconds an idle connection is kept open
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})  # Rate limiting and transient server errors
+
+# Pandas dtypes for Metabase column base types in columnar API payloads
+METABASE_DTYPES = {
+    'type/Integer': 'Int64',
+    'type/BigInteger': 'Int64',
+    'type/Float': 'float64',
+    'type/Decimal': 'float64',
+    'type/Boolean': 'boolean'
+}
+
+# Working directory at startup, used for credential lookup and diagnostics
+WORKING_DIRECTORY = os.getcwd()
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """
+    Create the HTTP session shared by all API fetches in a run.
+    
+    The connector keeps a small pool of keep-alive connections, so both fetches
+    and any retries reuse open TCP/TLS connections instead of reconnecting.
+    
+    Returns:
+        Configured aiohttp ClientSession (must be used inside a running event loop)
+    """
+    connector = aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT))
+
+
+async def fetch_api_data(session: aiohttp.ClientSession, url: str, data_type: str,
+                         max_retries: int = MAX_RETRIES) -> Optional[Dict[Any, Any]]:
     """
     Fetch data from API with retry logic and error handling.
     
     Args:
+        session: Shared aiohttp session used for the request
         url: API endpoint URL
         data_type: Type of data being fetched (for logging)
         max_retries: Maximum number of retry attempts
@@ -85,21 +150,25 @@ def fetch_api_data(url: str, data_type: str, max_retries: int = MAX_RETRIES) ->
     """
     for attempt in range(max_retries):
         try:
-            logger.info(f"Fetching {data_type} data from API (attempt {attempt + 1}/{max_retries})...")
+            logger.debug("Fetching %s data from API (attempt %d/%d)...", data_type, attempt + 1, max_retries)
             
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()  # Raises HTTPError for bad responses
+            async with session.get(url) as response:
+                response.raise_for_status()  # Raises ClientResponseError for bad responses
+                data = orjson.loads(await response.read())
             
-            data = response.json()
-            logger.info(f"Successfully fetched {len(data)} {data_type} records from API")
+            logger.info(f"Successfully fetched {_record_count(data)} {data_type} records from API")
             return data
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Client errors (e.g. 404) will not succeed on retry; only transient statuses are retried
+            if isinstance(e, aiohttp.ClientResponseError) and e.status not in RETRY_STATUSES:
+                logger.error(f"{data_type} API request failed with non-retryable status {e.status}: {e.message}")
+                break
             logger.warning(f"{data_type} API request failed (attempt {attempt + 1}/{max_retries}): {e}")
             
             if attempt < max_retries - 1:
                 logger.info(f"Retrying in {RETRY_DELAY} seconds...")
-                time.sleep(RETRY_DELAY)
+                await asyncio.sleep(RETRY_DELAY)
             else:
                 logger.error(f"Max retries reached. {data_type} API fetch failed.")
                 
@@ -113,165 +182,308 @@ def fetch_api_data(url: str, data_type: str, max_retries: int = MAX_RETRIES) ->
     return None
 
 
-def process_orders_dataframe(data: Dict[Any, Any]) -> Optional[pd.DataFrame]:
+def _has_dtype(series: pd.Series, dtype: type) -> bool:
+    """
+    Check whether a column already holds the target type, so its cast can be skipped.
+    
+    Args:
+        series: Column to check
+        dtype: Target Python type (int or str)
+        
+    Returns:
+        True if no conversion is needed, False otherwise
+    """
+    if dtype is int:
+        return pd.api.types.is_integer_dtype(series.dtype)
+    if dtype is str:
+        return pd.api.types.infer_dtype(series, skipna=False) == 'string'
+    return False
+
+
+def _columnar_payload(data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Return the Metabase ``{"cols": [...], "rows": [...]}`` payload if the data has that shape.
+    
+    Args:
+        data: Raw data from API
+        
+    Returns:
+        Columnar payload (unwrapped from ``"data"`` if nested) or None for any other shape
+    """
+    payload = data.get('data', data) if isinstance(data, dict) else data
+    if isinstance(payload, dict) and 'cols' in payload and 'rows' in payload:
+        return payload
+    return None
+
+
+def _record_count(data: Any) -> int:
+    """
+    Count the records in an API payload (rows for columnar payloads, items otherwise).
+    
+    Args:
+        data: Raw data from API
+        
+    Returns:
+        Number of records
+    """
+    payload = _columnar_payload(data)
+    return len(payload['rows']) if payload is not None else len(data)
+
+
+def _build_dataframe(data: Any) -> pd.DataFrame:
+    """
+    Build a DataFrame from an API payload, preferring the columnar Metabase shape.
+    
+    A Metabase ``{"cols": [...], "rows": [[...], ...]}`` payload (optionally nested
+    under ``"data"``) is built column-wise from the row arrays, with dtypes taken from
+    each column's ``base_type``. Any other payload falls back to ``pd.DataFrame(data)``.
+    
+    Args:
+        data: Raw data from API
+        
+    Returns:
+        DataFrame built from the payload
+    """
+    payload = _columnar_payload(data)
+    if payload is None:
+        return pd.DataFrame(data)
+    
+    cols = payload['cols']
+    df = pd.DataFrame(payload['rows'], columns=[col['name'] for col in cols])
+    
+    # Apply the declared types up front so numeric columns need no later cast;
+    # columns pandas already inferred correctly (e.g. null-free int64) are left alone.
+    # Columns are addressed by position since Metabase may return duplicate names.
+    for position, col in enumerate(cols):
+        dtype = METABASE_DTYPES.get(col.get('base_type'))
+        column = df.iloc[:, position]
+        if dtype is None or column.dtype == dtype:
+            continue
+        if dtype == 'Int64' and pd.api.types.is_integer_dtype(column.dtype):
+            continue
+        try:
+            df.isetitem(position, column.astype(dtype))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Failed to apply {dtype} hint to column '{col['name']}': {e}")
+            # Keep the column as inferred
+    return df
+
+
+def _process_dataframe(data: Dict[Any, Any], conversions: Mapping[str, type],
+                       data_type: str) -> Optional[pd.DataFrame]:
     """
-    Convert orders API data to DataFrame and apply data type conversions.
+    Convert API data to DataFrame and apply data type conversions.
     
     Args:
-        data: Raw orders data from API
+        data: Raw data from API
+        conversions: Target Python type (int or str) per column
+        data_type: Type of data being processed (for logging)
         
     Returns:
         Processed pandas DataFrame or None if processing failed
     """
+    label = data_type.capitalize()
     try:
-        logger.info("Converting orders data to DataFrame...")
-        df = pd.DataFrame(data)
+        logger.debug("Converting %s data to DataFrame...", data_type)
+        df = _build_dataframe(data)
         
-        if df.empty:
-            logger.warning("Orders DataFrame is empty")
+        n_rows, n_cols = df.shape
+        if not n_rows or not n_cols:
+            logger.warning(f"{label} DataFrame is empty")
             return None
         
-        logger.info(f"Orders DataFrame created with shape: {df.shape}")
-        logger.info(f"Orders columns: {list(df.columns)}")
-        
-        # Apply data type conversions with error handling for orders
-        conversions = {
-            'order_id': str,
-            'store_id': int,
-            'quantity': int
-        }
-        
-        for column, dtype in conversions.items():
-            if column in df.columns:
-                try:
-                    df[column] = df[column].astype(dtype)
-                    logger.info(f"Successfully converted orders {column} to {dtype.__name__}")
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Failed to convert orders {column} to {dtype.__name__}: {e}")
-                    # Continue with original data type
-            else:
-                logger.info(f"Orders column '{column}' not found in data")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s DataFrame created with shape: (%d, %d)", label, n_rows, n_cols)
+            logger.debug("%s columns: %s", label, list(df.columns))
+        
+        cast_map = {column: dtype for column, dtype in conversions.items() if column in df.columns}
+        for column in conversions:
+            if column not in cast_map:
+                logger.debug("%s column '%s' not found in data", label, column)
+            elif _has_dtype(df[column], cast_map[column]):
+                logger.debug("%s %s is already %s, skipping conversion", label, column, cast_map[column].__name__)
+                del cast_map[column]
+        
+        # Convert each column on its own so one failure keeps the rest, then apply them in a single assign;
+        # integer columns are coerced so dirty values become <NA>
+        converted = {}
+        for column, dtype in cast_map.items():
+            try:
+                if dtype is int:
+                    converted[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+                else:
+                    converted[column] = df[column].astype(dtype)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to convert {data_type} {column} to {dtype.__name__}: {e}")
+                # Continue with original data type
+        
+        if converted:
+            df = df.assign(**converted)
+            logger.debug("Successfully converted %s columns: %s", data_type, list(converted))
         
         return df
         
     except Exception as e:
-        logger.error(f"Error processing orders DataFrame: {e}")
+        logger.error(f"Error processing {data_type} DataFrame: {e}")
         return None
 
 
-def process_inventory_dataframe(data: Dict[Any, Any]) -> Optional[pd.DataFrame]:
+@functools.lru_cache(maxsize=1)
+def _resolved_credentials_path(credentials_file: str) -> str:
     """
-    Convert inventory API data to DataFrame and apply data type conversions.
+    Resolve the credentials file to the first existing absolute path.
+    
+    Checks the configured path first, then the current working directory. The
+    result is cached so the filesystem is only probed once per process.
     
     Args:
-        data: Raw inventory data from API
+        credentials_file: Configured path to the credentials JSON file
         
     Returns:
-        Processed pandas DataFrame or None if processing failed
+        Absolute path of the credentials file
+        
+    Raises:
+        FileNotFoundError: If the file exists in neither location
     """
-    try:
-        logger.info("Converting inventory data to DataFrame...")
-        df = pd.DataFrame(data)
+    abs_credentials_path = os.path.abspath(credentials_file)
+    if os.path.exists(abs_credentials_path):
+        return abs_credentials_path
+    
+    logger.error(f"Credentials file not found at: {abs_credentials_path}")
+    logger.info("Please ensure the credentials file exists and the path is correct")
+    
+    # Also check in current directory
+    current_dir_path = os.path.join(WORKING_DIRECTORY, os.path.basename(credentials_file))
+    logger.info(f"Checking in current directory: {current_dir_path}")
+    
+    if os.path.exists(current_dir_path):
+        logger.info(f"Found credentials file in current directory: {current_dir_path}")
+        return current_dir_path
+    
+    raise FileNotFoundError(f"Credentials file not found in current directory either: {current_dir_path}")
+
+
+def open_google_sheet(credentials_file: str, sheet_name: str) -> Optional[gspread.Spreadsheet]:
+    """
+    Authenticate with Google Sheets once and open the target spreadsheet.
+    
+    The returned spreadsheet wraps a single authorized HTTP session, so every
+    worksheet call made through it reuses the same token and keep-alive connection.
+    
+    Args:
+        credentials_file: Path to Google Sheets credentials JSON file
+        sheet_name: Name of the Google Sheet
         
-        if df.empty:
-            logger.warning("Inventory DataFrame is empty")
-            return None
+    Returns:
+        Opened gspread Spreadsheet or None if authentication or lookup failed
+    """
+    try:
+        credentials_file = _resolved_credentials_path(credentials_file)
         
-        logger.info(f"Inventory DataFrame created with shape: {df.shape}")
-        logger.info(f"Inventory columns: {list(df.columns)}")
-        
-        # Apply data type conversions with error handling for inventory
-        conversions = {
-            'store_id': int,
-            'quantity': int
-        }
-        
-        for column, dtype in conversions.items():
-            if column in df.columns:
-                try:
-                    df[column] = df[column].astype(dtype)
-                    logger.info(f"Successfully converted inventory {column} to {dtype.__name__}")
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Failed to convert inventory {column} to {dtype.__name__}: {e}")
-                    # Continue with original data type
-            else:
-                logger.info(f"Inventory column '{column}' not found in data")
+        logger.info("Authenticating with Google Sheets using credentials file: %s", credentials_file)
+        gc = gspread.service_account(filename=credentials_file)
         
-        return df
+        logger.debug("Opening Google Sheet: %s", sheet_name)
+        return gc.open(sheet_name)
         
+    except gspread.exceptions.SpreadsheetNotFound:
+        logger.error(f"Spreadsheet '{sheet_name}' not found. Please check the name and permissions.")
+        return None
+    except gspread.exceptions.APIError as e:
+        logger.error(f"Google Sheets API error while opening '{sheet_name}': {e}")
+        return None
+    except FileNotFoundError as e:
+        logger.error(f"Credentials file not found: {e}")
+        logger.info(f"Expected path: {os.path.abspath(credentials_file)}")
+        logger.info(f"Current working directory: {WORKING_DIRECTORY}")
+        return None
     except Exception as e:
-        logger.error(f"Error processing inventory DataFrame: {e}")
+        logger.error(f"Unexpected error while opening Google Sheet: {e}")
+        logger.info(f"Credentials file path being used: {repr(os.path.abspath(credentials_file))}")
+        logger.info(f"Current working directory: {WORKING_DIRECTORY}")
         return None
 
 
-def upload_to_google_sheets(df: pd.DataFrame, credentials_file: str, 
-                          sheet_name: str, worksheet_name: str, 
-                          start_row: int, start_col: int, data_type: str) -> bool:
+def upload_to_google_sheets(sh: gspread.Spreadsheet, df: pd.DataFrame, worksheet_name: str,
+                            start_row: int, start_col: int, data_type: str) -> bool:
     """
     Upload DataFrame to Google Sheets with error handling.
     
     Args:
+        sh: Spreadsheet opened by open_google_sheet
         df: DataFrame to upload
-        credentials_file: Path to Google Sheets credentials JSON file
-        sheet_name: Name of the Google Sheet
         worksheet_name: Name of the worksheet within the sheet
-        start_row: Starting row position (A=1)
-        start_col: Starting column position
+        start_row: Starting row position
+        start_col: Starting column position (A=1)
         data_type: Type of data being uploaded (for logging)
         
     Returns:
         True if upload successful, False otherwise
     """
     try:
-        logger.info(f"Importing Google Sheets libraries for {data_type}...")
-        import gspread
-        from gspread_dataframe import set_with_dataframe
-        
-        # Validate credentials file path
-        abs_credentials_path = os.path.abspath(credentials_file)
-        logger.info(f"Checking credentials file for {data_type}: {abs_credentials_path}")
-        
-        if not os.path.exists(abs_credentials_path):
-            logger.error(f"Credentials file not found at: {abs_credentials_path}")
-            logger.info("Please ensure the credentials file exists and the path is correct")
-            
-            # Also check in current directory
-            current_dir_path = os.path.join(os.getcwd(), os.path.basename(credentials_file))
-            logger.info(f"Checking in current directory: {current_dir_path}")
-            
-            if os.path.exists(current_dir_path):
-                logger.info(f"Found credentials file in current directory: {current_dir_path}")
-                credentials_file = current_dir_path
-            else:
-                logger.error("Credentials file not found in current directory either")
-                return False
-        else:
-            credentials_file = abs_credentials_path
-        
-        logger.info(f"Using credentials file for {data_type}: {credentials_file}")
-        logger.info(f"Authenticating with Google Sheets for {data_type}...")
-        gc = gspread.service_account(filename=credentials_file)
-        
-        logger.info(f"Opening Google Sheet for {data_type}: {sheet_name}")
-        sh = gc.open(sheet_name)
-        
         # Try to get the specific worksheet, create if it doesn't exist
         try:
             worksheet = sh.worksheet(worksheet_name)
-            logger.info(f"Found existing worksheet: {worksheet_name}")
+            logger.debug("Found existing worksheet: %s", worksheet_name)
         except gspread.WorksheetNotFound:
             logger.info(f"Worksheet '{worksheet_name}' not found. Creating new worksheet...")
             worksheet = sh.add_worksheet(title=worksheet_name, rows=1000, cols=20)
         
-        logger.info(f"Clearing existing {data_type} data...")
-        worksheet.clear()
+        # Flatten the DataFrame (header + rows) into a list of lists, blanking out missing values
+        # in one vectorized pass over a single object array
+        arr = df.to_numpy(dtype=object)
+        arr = np.where(pd.isna(arr), "", arr)
+        
+        # Nested JSON cells (lists/dicts) would be sent as nested arrays, which values.update
+        # rejects, so write them as their string form like set_with_dataframe did. Only
+        # object-dtype columns can hold them, so numeric/string columns are not scanned.
+        for position in np.flatnonzero((df.dtypes == object).to_numpy()):
+            for row, value in enumerate(arr[:, position]):
+                if isinstance(value, (list, dict)):
+                    arr[row, position] = str(value)
+        values = [df.columns.tolist()] + arr.tolist()
+        needed_rows, needed_cols = start_row + len(values) - 1, start_col + len(df.columns) - 1
+        range_name = f"{rowcol_to_a1(start_row, start_col)}:{rowcol_to_a1(needed_rows, needed_cols)}"
+        
+        # Clear the old data (growing the grid first if the data would not fit) in one batchUpdate
+        requests_body = []
+        if needed_rows > worksheet.row_count or needed_cols > worksheet.col_count:
+            requests_body.append({
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': worksheet.id,
+                        'gridProperties': {
+                            'rowCount': max(needed_rows, worksheet.row_count),
+                            'columnCount': max(needed_cols, worksheet.col_count)
+                        }
+                    },
+                    'fields': 'gridProperties.rowCount,gridProperties.columnCount'
+                }
+            })
+        requests_body.append({
+            'updateCells': {
+                'range': {'sheetId': worksheet.id},
+                'fields': 'userEnteredValue'
+            }
+        })
         
-        # Convert column number to letter for logging
-        col_letter = chr(64 + start_col)  # A=1, B=2, etc.
-        logger.info(f"Uploading {data_type} DataFrame to Google Sheets at row {start_row}, column {start_col} ({col_letter})...")
-        set_with_dataframe(worksheet, df, row=start_row, col=start_col)
+        logger.debug("Clearing %s worksheet '%s'...", data_type, worksheet_name)
+        sh.batch_update({'requests': requests_body})
         
-        logger.info(f"✅ {data_type} DataFrame successfully uploaded to Google Sheet '{sheet_name}' -> '{worksheet_name}'")
+        # Write the values with a raw values.update call over gspread's authorized session,
+        # sending the 2-D array as orjson-encoded JSON instead of per-cell objects
+        url = SPREADSHEET_VALUES_URL % (sh.id, quote(absolute_range_name(worksheet.title, range_name), safe=''))
+        logger.debug("Uploading %s DataFrame to Google Sheets range %s...", data_type, range_name)
+        response = sh.client.session.put(
+            url,
+            params={'valueInputOption': 'RAW'},
+            data=orjson.dumps({'values': values}, default=str, option=orjson.OPT_SERIALIZE_NUMPY),  # str() for e.g. Timestamps
+            headers={'Content-Type': 'application/json'}
+        )
+        if not response.ok:
+            raise gspread.exceptions.APIError(response)
+        
+        logger.info(f"✅ {data_type} DataFrame successfully uploaded to Google Sheet '{sh.title}' -> '{worksheet_name}'")
         logger.info(f"   Uploaded {len(df)} {data_type} rows and {len(df.columns)} columns")
         
         return True
@@ -279,25 +491,19 @@ def upload_to_google_sheets(df: pd.DataFrame, credentials_file: str,
     except gspread.exceptions.APIError as e:
         logger.error(f"Google Sheets API error for {data_type}: {e}")
         return False
-    except gspread.exceptions.SpreadsheetNotFound:
-        logger.error(f"Spreadsheet '{sheet_name}' not found. Please check the name and permissions.")
-        return False
-    except FileNotFoundError as e:
-        logger.error(f"Credentials file not found for {data_type}: {e}")
-        logger.info(f"Expected path: {os.path.abspath(credentials_file)}")
-        logger.info(f"Current working directory: {os.getcwd()}")
-        return False
     except Exception as e:
         logger.error(f"Unexpected error during {data_type} Google Sheets upload: {e}")
-        logger.info(f"Credentials file path being used: {repr(os.path.abspath(credentials_file))}")
-        logger.info(f"Current working directory: {os.getcwd()}")
         return False
 
 
-def process_orders() -> bool:
+async def process_orders(session: aiohttp.ClientSession, sheet: Awaitable[Optional[gspread.Spreadsheet]]) -> bool:
     """
     Process orders data: fetch, convert to DataFrame, and upload to Google Sheets.
     
+    Args:
+        session: Shared aiohttp session used for the API request
+        sheet: Awaitable resolving to the shared spreadsheet (opened once per run)
+        
     Returns:
         True if successful, False otherwise
     """
@@ -305,22 +511,27 @@ def process_orders() -> bool:
     logger.info("-" * 50)
     
     # Fetch orders data from API
-    orders_data = fetch_api_data(ORDERS_API_URL, "orders")
+    orders_data = await fetch_api_data(session, ORDERS_API_URL, "orders")
     if orders_data is None:
         logger.error("Failed to fetch orders data from API")
         return False
     
-    # Process orders data into DataFrame
-    orders_df = process_orders_dataframe(orders_data)
+    # Process orders data into DataFrame (off the event loop)
+    orders_df = await asyncio.to_thread(_process_dataframe, orders_data, ORDERS_CONVERSIONS, "orders")
     if orders_df is None:
         logger.error("Failed to process orders data")
         return False
     
-    # Upload orders to Google Sheets
-    orders_success = upload_to_google_sheets(
+    sh = await sheet
+    if sh is None:
+        logger.error("Google Sheet is not available, skipping orders upload")
+        return False
+    
+    # Upload orders to Google Sheets (gspread is blocking, so run it in a worker thread)
+    orders_success = await asyncio.to_thread(
+        upload_to_google_sheets,
+        sh=sh,
         df=orders_df,
-        credentials_file=CREDENTIALS_FILE,
-        sheet_name=SHEET_NAME,
         worksheet_name=ORDERS_WORKSHEET_NAME,
         start_row=ORDERS_START_ROW,
         start_col=ORDERS_START_COL,
@@ -337,10 +548,14 @@ def process_orders() -> bool:
         return False
 
 
-def process_inventory() -> bool:
+async def process_inventory(session: aiohttp.ClientSession, sheet: Awaitable[Optional[gspread.Spreadsheet]]) -> bool:
     """
     Process inventory data: fetch, convert to DataFrame, and upload to Google Sheets.
     
+    Args:
+        session: Shared aiohttp session used for the API request
+        sheet: Awaitable resolving to the shared spreadsheet (opened once per run)
+        
     Returns:
         True if successful, False otherwise
     """
@@ -348,22 +563,27 @@ def process_inventory() -> bool:
     logger.info("-" * 50)
     
     # Fetch inventory data from API
-    inventory_data = fetch_api_data(INVENTORY_API_URL, "inventory")
+    inventory_data = await fetch_api_data(session, INVENTORY_API_URL, "inventory")
     if inventory_data is None:
         logger.error("Failed to fetch inventory data from API")
         return False
     
-    # Process inventory data into DataFrame
-    inventory_df = process_inventory_dataframe(inventory_data)
+    # Process inventory data into DataFrame (off the event loop)
+    inventory_df = await asyncio.to_thread(_process_dataframe, inventory_data, INVENTORY_CONVERSIONS, "inventory")
     if inventory_df is None:
         logger.error("Failed to process inventory data")
         return False
     
-    # Upload inventory to Google Sheets
-    inventory_success = upload_to_google_sheets(
+    sh = await sheet
+    if sh is None:
+        logger.error("Google Sheet is not available, skipping inventory upload")
+        return False
+    
+    # Upload inventory to Google Sheets (gspread is blocking, so run it in a worker thread)
+    inventory_success = await asyncio.to_thread(
+        upload_to_google_sheets,
+        sh=sh,
         df=inventory_df,
-        credentials_file=CREDENTIALS_FILE,
-        sheet_name=SHEET_NAME,
         worksheet_name=INVENTORY_WORKSHEET_NAME,
         start_row=INVENTORY_START_ROW,
         start_col=INVENTORY_START_COL,
@@ -380,51 +600,56 @@ def process_inventory() -> bool:
         return False
 
 
-def main():
+async def main():
     """Main execution function with comprehensive error handling."""
     try:
         logger.info("=" * 80)
         logger.info("STARTING ORDERS AND INVENTORY DATA PROCESSING")
         logger.info("=" * 80)
-        logger.info(f"Script started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("Script started")
         
-        # Process inventory first
-        inventory_success = process_inventory()
-
-        # Process orders second
-        orders_success = process_orders()
+        # Authenticate with Google Sheets once, in the background, while the API fetches run
+        sheet = asyncio.ensure_future(asyncio.to_thread(open_google_sheet, CREDENTIALS_FILE, SHEET_NAME))
+        
+        # Process inventory and orders concurrently over a single shared HTTP session
+        async with create_http_session() as session:
+            inventory_success, orders_success = await asyncio.gather(
+                process_inventory(session, sheet),
+                process_orders(session, sheet)
+            )
         
         # Final status
         if orders_success and inventory_success:
             logger.info("🎉 ALL DATA PROCESSING COMPLETED SUCCESSFULLY!")
             logger.info("   ✅ Orders data updated successfully")
             logger.info("   ✅ Inventory data updated successfully")
-            logger.info(f"Script completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            logger.info("Script completed")
             logger.info("=" * 80)
             return True
         else:
             logger.error("❌ DATA PROCESSING COMPLETED WITH ERRORS:")
             logger.info(f"   Orders: {'✅ Success' if orders_success else '❌ Failed'}")
             logger.info(f"   Inventory: {'✅ Success' if inventory_success else '❌ Failed'}")
-            logger.info(f"Script completed with errors at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            logger.info("Script completed with errors")
             logger.info("=" * 80)
             return False
             
-    except KeyboardInterrupt:
-        logger.info("Process interrupted by user")
-        logger.info(f"Script interrupted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        return False
     except Exception as e:
         logger.error(f"Unexpected error in main execution: {e}")
-        logger.info(f"Script failed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("Script failed")
         return False
 
 
 if __name__ == "__main__":
-    from time import time
-    start = time()
-    success = main()
-    end = time()
+    from time import perf_counter
+    start = perf_counter()
+    try:
+        success = asyncio.run(main())
+    except KeyboardInterrupt:
+        # asyncio.run cancels the main task and re-raises the interrupt here
+        logger.info("Process interrupted by user")
+        success = False
+    end = perf_counter()
     logger.info(f"Total execution time: {end - start:.2f} seconds")
     logger.info(f"Check detailed logs at: {os.path.abspath(log_filepath)}")
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,6 @@
+import os
+
+# app.main reads its configuration at import time, so the required variables must be set first
+os.environ.setdefault('ORDERS_API_URL', 'https://example.com/orders')
+os.environ.setdefault('INVENTORY_API_URL', 'https://example.com/inventory')
+os.environ.setdefault('SHEET_NAME', 'Test Sheet')
@@ -0,0 +1,67 @@
+import pytest
+
+from app.conf.config import get_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
+def test_get_config_defaults(monkeypatch):
+    for var in ('MAX_RETRIES', 'RETRY_DELAY', 'ORDERS_START_COL', 'ORDERS_WORKSHEET_NAME'):
+        monkeypatch.delenv(var, raising=False)
+
+    cfg = get_config()
+
+    assert cfg.max_retries == 3
+    assert cfg.retry_delay == 5
+    assert cfg.orders_start_col == 1
+    assert cfg.orders_worksheet_name == 'Orders'
+
+
+def test_get_config_casts_integers(monkeypatch):
+    monkeypatch.setenv('MAX_RETRIES', '5')
+    monkeypatch.setenv('INVENTORY_START_ROW', '2')
+
+    cfg = get_config()
+
+    assert cfg.max_retries == 5
+    assert cfg.inventory_start_row == 2
+
+
+def test_get_config_is_cached():
+    assert get_config() is get_config()
+
+
+@pytest.mark.parametrize('var', ['ORDERS_API_URL', 'INVENTORY_API_URL', 'SHEET_NAME'])
+def test_get_config_missing_required_variable(monkeypatch, var):
+    monkeypatch.delenv(var, raising=False)
+
+    with pytest.raises(ValueError, match=var):
+        get_config()
+
+
+def test_get_config_malformed_integer(monkeypatch):
+    monkeypatch.setenv('MAX_RETRIES', 'three')
+
+    with pytest.raises(ValueError, match='MAX_RETRIES must be an integer'):
+        get_config()
+
+
+
+@pytest.mark.parametrize('var', ['ORDERS_START_ROW', 'ORDERS_START_COL', 'INVENTORY_START_ROW', 'INVENTORY_START_COL'])
+def test_get_config_position_out_of_range(monkeypatch, var):
+    monkeypatch.setenv(var, '0')
+
+    with pytest.raises(ValueError, match=f'{var} must be >= 1'):
+        get_config()
+
+
+def test_get_config_retry_settings_out_of_range(monkeypatch):
+    monkeypatch.setenv('MAX_RETRIES', '0')
+
+    with pytest.raises(ValueError, match='MAX_RETRIES must be >= 1'):
+        get_config()
@@ -0,0 +1,164 @@
+import pandas as pd
+import pytest
+
+from app.main import (
+    INVENTORY_CONVERSIONS,
+    ORDERS_CONVERSIONS,
+    _build_dataframe,
+    _has_dtype,
+    _process_dataframe,
+    _record_count,
+)
+
+
+def metabase_payload(cols, rows):
+    return {'data': {'cols': cols, 'rows': rows}}
+
+
+def test_build_dataframe_from_nested_columnar_payload():
+    data = metabase_payload(
+        [
+            {'name': 'store_id', 'base_type': 'type/Integer'},
+            {'name': 'quantity', 'base_type': 'type/Integer'},
+            {'name': 'sku', 'base_type': 'type/Text'},
+        ],
+        [[1, None, 'a'], [2, 3, 'b']],
+    )
+
+    df = _build_dataframe(data)
+
+    assert list(df.columns) == ['store_id', 'quantity', 'sku']
+    assert df['quantity'].dtype == 'Int64'
+    assert df['quantity'].isna().tolist() == [True, False]
+
+
+def test_build_dataframe_from_top_level_columnar_payload():
+    data = {'cols': [{'name': 'sku', 'base_type': 'type/Text'}], 'rows': [['a'], ['b']]}
+
+    df = _build_dataframe(data)
+
+    assert df['sku'].tolist() == ['a', 'b']
+
+
+def test_build_dataframe_skips_hints_already_inferred():
+    data = metabase_payload(
+        [
+            {'name': 'store_id', 'base_type': 'type/Integer'},
+            {'name': 'price', 'base_type': 'type/Float'},
+        ],
+        [[1, 1.5], [2, 2.5]],
+    )
+
+    df = _build_dataframe(data)
+
+    # Null-free integers keep pandas' inferred int64 rather than being copied to Int64
+    assert df['store_id'].dtype == 'int64'
+    assert df['price'].dtype == 'float64'
+
+
+def test_build_dataframe_handles_duplicate_column_names():
+    data = metabase_payload(
+        [
+            {'name': 'quantity', 'base_type': 'type/Integer'},
+            {'name': 'quantity', 'base_type': 'type/Integer'},
+        ],
+        [[1, None], [2, 3]],
+    )
+
+    df = _build_dataframe(data)
+
+    assert df.dtypes.tolist() == ['int64', 'Int64']
+
+
+def test_build_dataframe_keeps_column_when_hint_cast_fails():
+    data = metabase_payload(
+        [
+            {'name': 'price', 'base_type': 'type/Float'},
+            {'name': 'quantity', 'base_type': 'type/Integer'},
+        ],
+        [['N/A', None], ['2.5', 3]],
+    )
+
+    df = _build_dataframe(data)
+
+    assert df['price'].tolist() == ['N/A', '2.5']
+    assert df['quantity'].dtype == 'Int64'
+
+
+def test_process_dataframe_keeps_rows_with_dirty_hinted_column():
+    # 'price' is not in the conversions map, so only the hint step touches it
+    data = metabase_payload(
+        [
+            {'name': 'sku', 'base_type': 'type/Text'},
+            {'name': 'price', 'base_type': 'type/Float'},
+        ],
+        [['a', 'N/A'], ['b', '2.5']],
+    )
+
+    df = _process_dataframe(data, INVENTORY_CONVERSIONS, 'inventory')
+
+    assert df is not None
+    assert df.shape == (2, 2)
+
+
+def test_build_dataframe_falls_back_to_records():
+    data = [{'sku': 'a', 'quantity': 1}, {'sku': 'b', 'quantity': 2}]
+
+    df = _build_dataframe(data)
+
+    assert df.shape == (2, 2)
+    assert df['quantity'].tolist() == [1, 2]
+
+
+def test_record_count():
+    assert _record_count(metabase_payload([{'name': 'sku'}], [['a'], ['b'], ['c']])) == 3
+    assert _record_count([{'sku': 'a'}, {'sku': 'b'}]) == 2
+
+
+def test_has_dtype():
+    assert _has_dtype(pd.Series([1, 2]), int)
+    assert _has_dtype(pd.Series([1, None], dtype='Int64'), int)
+    assert not _has_dtype(pd.Series(['1', '2']), int)
+    assert _has_dtype(pd.Series(['a', 'b']), str)
+    assert not _has_dtype(pd.Series(['a', 1], dtype=object), str)
+
+
+def test_process_dataframe_applies_conversions():
+    data = [
+        {'order_id': 10, 'store_id': '1', 'quantity': '2'},
+        {'order_id': 11, 'store_id': '3', 'quantity': 'n/a'},
+    ]
+
+    df = _process_dataframe(data, ORDERS_CONVERSIONS, 'orders')
+
+    assert df['order_id'].tolist() == ['10', '11']
+    assert df['store_id'].dtype == 'Int64'
+    assert df['store_id'].tolist() == [1, 3]
+    # Dirty integer values are coerced to <NA> instead of failing the cast
+    assert df['quantity'].isna().tolist() == [False, True]
+
+
+def test_process_dataframe_keeps_other_conversions_when_one_fails():
+    data = [{'order_id': 10, 'store_id': 1.5, 'quantity': '2'}]
+
+    df = _process_dataframe(data, ORDERS_CONVERSIONS, 'orders')
+
+    assert df['store_id'].dtype == 'float64'
+    assert df['order_id'].tolist() == ['10']
+    assert df['quantity'].dtype == 'Int64'
+
+
+def test_process_dataframe_skips_columns_with_matching_dtype():
+    df = _process_dataframe([{'store_id': 1, 'quantity': 2}], INVENTORY_CONVERSIONS, 'inventory')
+
+    assert df['store_id'].dtype == 'int64'
+    assert df['quantity'].dtype == 'int64'
+
+
+def test_process_dataframe_returns_none_for_empty_data():
+    assert _process_dataframe([], INVENTORY_CONVERSIONS, 'inventory') is None
+
+
+def test_conversion_maps_are_read_only():
+    with pytest.raises(TypeError):
+        ORDERS_CONVERSIONS['order_id'] = int
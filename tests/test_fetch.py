@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import app.main
+from app.main import create_http_session, fetch_api_data
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(app.main, 'RETRY_DELAY', 0)
+
+
+def fetch_with_statuses(statuses, max_retries=3):
+    """Serve the given statuses in order (then 200 with JSON) and fetch once; return (data, calls)."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        if len(calls) <= len(statuses):
+            return web.Response(status=statuses[len(calls) - 1])
+        return web.json_response([{'sku': 'a'}, {'sku': 'b'}])
+
+    async def run():
+        api = web.Application()
+        api.router.add_get('/data', handler)
+        async with TestServer(api) as server:
+            async with create_http_session() as session:
+                return await fetch_api_data(session, str(server.make_url('/data')), 'orders', max_retries)
+
+    return asyncio.run(run()), len(calls)
+
+
+def test_fetch_returns_parsed_json():
+    data, calls = fetch_with_statuses([])
+
+    assert data == [{'sku': 'a'}, {'sku': 'b'}]
+    assert calls == 1
+
+
+@pytest.mark.parametrize('status', [429, 500, 502, 503, 504])
+def test_fetch_retries_transient_statuses(status):
+    data, calls = fetch_with_statuses([status, status])
+
+    assert data == [{'sku': 'a'}, {'sku': 'b'}]
+    assert calls == 3
+
+
+def test_fetch_gives_up_after_max_retries():
+    data, calls = fetch_with_statuses([503, 503, 503], max_retries=3)
+
+    assert data is None
+    assert calls == 3
+
+
+@pytest.mark.parametrize('status', [400, 401, 404])
+def test_fetch_does_not_retry_client_errors(status):
+    data, calls = fetch_with_statuses([status])
+
+    assert data is None
+    assert calls == 1
@@ -0,0 +1,142 @@
+from urllib.parse import unquote
+
+import orjson
+import pandas as pd
+
+from app.main import upload_to_google_sheets
+
+
+class FakeResponse:
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.text = ''
+
+    def json(self):
+        return {'error': {'code': 400, 'message': 'Invalid values', 'status': 'INVALID_ARGUMENT'}}
+
+
+class FakeSession:
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.puts = []
+
+    def put(self, url, params=None, data=None, headers=None):
+        self.puts.append({'url': url, 'params': params, 'body': orjson.loads(data), 'headers': headers})
+        return FakeResponse(self.ok)
+
+
+class FakeClient:
+    def __init__(self, ok=True):
+        self.session = FakeSession(ok)
+
+
+class FakeWorksheet:
+    id = 7
+    title = 'Orders Sheet'
+    row_count = 1000
+    col_count = 20
+
+
+class FakeSpreadsheet:
+    id = 'spreadsheet-id'
+    title = 'Test Sheet'
+
+    def __init__(self, ok=True, worksheet=None):
+        self.client = FakeClient(ok)
+        self.worksheet_obj = worksheet or FakeWorksheet()
+        self.batch_updates = []
+
+    def worksheet(self, name):
+        return self.worksheet_obj
+
+    def batch_update(self, body):
+        self.batch_updates.append(body)
+
+
+def upload(df, start_row=1, start_col=1, **kwargs):
+    sh = FakeSpreadsheet(**kwargs)
+    success = upload_to_google_sheets(sh, df, 'Orders Sheet', start_row, start_col, 'orders')
+    return success, sh
+
+
+def test_upload_puts_values_to_quoted_range():
+    success, sh = upload(pd.DataFrame({'sku': ['a', 'b'], 'quantity': [1, 2]}))
+
+    assert success
+    [put] = sh.client.session.puts
+    assert put['url'] == (
+        'https://sheets.googleapis.com/v4/spreadsheets/spreadsheet-id/values/'
+        '%27Orders%20Sheet%27%21A1%3AB3'
+    )
+    assert put['params'] == {'valueInputOption': 'RAW'}
+    assert put['body'] == {'values': [['sku', 'quantity'], ['a', 1], ['b', 2]]}
+
+
+def test_upload_range_is_offset_by_start_position():
+    success, sh = upload(pd.DataFrame({'sku': ['a', 'b'], 'quantity': [1, 2]}), start_row=2, start_col=3)
+
+    [put] = sh.client.session.puts
+    assert unquote(put['url']).endswith("'Orders Sheet'!C2:D4")
+
+
+def test_upload_stringifies_nested_and_non_json_cells():
+    df = pd.DataFrame({
+        'tags': [['a', 'b'], {'k': 1}],
+        'updatedAt': [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-02')],
+    })
+
+    success, sh = upload(df)
+
+    assert success
+    [put] = sh.client.session.puts
+    assert put['body']['values'][1:] == [
+        ["['a', 'b']", '2024-01-01 00:00:00'],
+        ["{'k': 1}", '2024-01-02 00:00:00'],
+    ]
+
+
+def test_upload_returns_false_on_api_error():
+    success, sh = upload(pd.DataFrame({'sku': ['a']}), ok=False)
+
+    assert not success
+    assert len(sh.client.session.puts) == 1
+
+
+def test_upload_clears_worksheet_in_one_batch_update():
+    success, sh = upload(pd.DataFrame({'sku': ['a']}))
+
+    assert success
+    assert sh.batch_updates == [
+        {'requests': [{'updateCells': {'range': {'sheetId': 7}, 'fields': 'userEnteredValue'}}]}
+    ]
+
+
+def test_upload_grows_grid_when_data_does_not_fit():
+    worksheet = FakeWorksheet()
+    worksheet.row_count, worksheet.col_count = 2, 1
+
+    success, sh = upload(pd.DataFrame({'sku': ['a', 'b'], 'quantity': [1, 2]}), start_row=2, worksheet=worksheet)
+
+    assert success
+    [body] = sh.batch_updates
+    assert body['requests'][0] == {
+        'updateSheetProperties': {
+            'properties': {'sheetId': 7, 'gridProperties': {'rowCount': 4, 'columnCount': 2}},
+            'fields': 'gridProperties.rowCount,gridProperties.columnCount'
+        }
+    }
+    assert 'updateCells' in body['requests'][1]
+
+
+def test_upload_blanks_missing_values():
+    df = pd.DataFrame({
+        'sku': ['a', None],
+        'quantity': pd.array([1, None], dtype='Int64'),
+        'price': [float('nan'), 2.5],
+    })
+
+    success, sh = upload(df)
+
+    assert success
+    [put] = sh.client.session.puts
+    assert put['body']['values'][1:] == [['a', 1, ''], ['', '', 2.5]]